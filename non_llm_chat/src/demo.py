@@ -5,7 +5,6 @@ This script demonstrates how to use the chatbot classes and Flask app.
 
 import sys
 import os
-import time
 import logging
 
 # Add the src directory to Python path
@@ -42,12 +41,13 @@ def demo_basic_chatbot():
     print("\nTesting chatbot responses:")
     print("-" * 30)
     
-    for message in test_messages:
-        response = bot.get_response(message)
+    # Collect all responses first, then print them in one pass
+    results = [(message, bot.get_response(message)) for message in test_messages]
+    
+    for message, response in results:
         print(f"User: {message}")
         print(f"Bot:  {response}")
         print()
-        time.sleep(1)  # Small delay for readability
     
     # Cleanup
     bot.cleanup()
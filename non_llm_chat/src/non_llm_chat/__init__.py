@@ -5,9 +5,7 @@ A Flask-based chatbot implementation using ChatterBot library for Databricks Ass
 This package provides basic chatbot functionality without relying on large language models.
 """
 
-from .chatbot import BasicChatBot, ChatBotManager
-from .flask_app import ChatBotFlaskApp, create_app
-from .main import main, databricks_main
+import importlib
 
 __version__ = "0.0.1"
 __author__ = "alan.dennis@gmail.com"
@@ -15,8 +13,32 @@ __author__ = "alan.dennis@gmail.com"
 __all__ = [
     "BasicChatBot",
     "ChatBotManager", 
+    "ResponseCache",
     "ChatBotFlaskApp",
     "create_app",
     "main",
     "databricks_main"
-]
\ No newline at end of file
+]
+
+# Submodules pull in ChatterBot, NLTK and Flask, so they are only imported
+# when one of their names is first accessed (PEP 562).
+_LAZY_EXPORTS = {
+    "BasicChatBot": "chatbot",
+    "ChatBotManager": "chatbot",
+    "ResponseCache": "chatbot",
+    "ChatBotFlaskApp": "flask_app",
+    "create_app": "flask_app",
+    "main": "main",
+    "databricks_main": "main",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    # Cache on the package; this also replaces the 'main' submodule binding
+    # that the import above leaves behind with the main() function.
+    globals()[name] = value
+    return value
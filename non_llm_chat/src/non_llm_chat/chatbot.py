@@ -3,16 +3,273 @@ Basic chatbot implementation using ChatterBot library.
 This module provides a non-LLM chatbot for Databricks Asset Bundle deployment.
 """
 
-from chatterbot import ChatBot
-from chatterbot.trainers import ChatterBotCorpusTrainer, ListTrainer
-from chatterbot.response_selection import get_random_response
-from chatterbot.logic import BestMatch
+from collections import OrderedDict
+import functools
+from rapidfuzz import fuzz
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 import logging
 import os
-from typing import List, Optional
+import threading
+import uuid
+import weakref
+from typing import List, Optional, Sequence
 import time 
 time.clock = time.time
 
+# TimeLogicAdapter replies embed the current clock, so they must never be cached.
+_TIME_RESPONSE_PREFIX = "The current time is "
+
+# Sent by prewarm(); deliberately not part of any training conversation
+_PREWARM_MESSAGE = "Prewarm the response pipeline"
+
+# Minimum BestMatch similarity for a known statement's reply to be used
+_SIMILARITY_THRESHOLD = 0.90
+
+_LOGIC_ADAPTERS = (
+    {
+        'import_path': 'chatterbot.logic.BestMatch',
+        'default_response': 'I am sorry, I do not understand. Could you please rephrase?',
+        'maximum_similarity_threshold': _SIMILARITY_THRESHOLD
+    },
+    {
+        'import_path': 'chatterbot.logic.MathematicalEvaluation',
+    },
+    {
+        'import_path': 'chatterbot.logic.TimeLogicAdapter',
+    },
+)
+
+# Columns ChatterBot filters by equality on every response: candidate replies
+# are looked up by search_in_response_to and recent history by conversation.
+_STATEMENT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_statement_search_in_response_to "
+    "ON statement (search_in_response_to)",
+    "CREATE INDEX IF NOT EXISTS ix_statement_conversation ON statement (conversation)",
+)
+
+# One row per one-time training step; claiming a row with INSERT OR IGNORE is
+# atomic in SQLite, so only one of several processes starting on a fresh
+# database runs that step. The value is 'claimed' while the step runs and
+# 'trained' once it has succeeded; a failed run deletes its claim. The claim
+# records its owner and when it was made, so it can only be settled by the run
+# that made it and only taken over once its lease has expired.
+_TRAINING_META_TABLE = (
+    "CREATE TABLE IF NOT EXISTS training_meta "
+    "(k TEXT PRIMARY KEY, v TEXT, owner TEXT, claimed_at REAL)"
+)
+
+# Seconds a training claim is honoured. ListTrainer stores every statement in
+# one write at the end of train(), so an empty statement table does not mean
+# the claiming run has died; only a claim older than this is considered stale.
+_TRAINING_CLAIM_LEASE = 600.0
+
+# Applied to every new pooled connection: WAL lets readers run alongside the
+# per-message learning write, and the larger page cache/mmap keep the
+# statement table in memory across requests.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+# Basic conversation pattern, alternating statement and reply; "{name}" is
+# filled in with the bot's name at training time.
+_BASIC_CONVERSATIONS = (
+    "Hello",
+    "Hi there!",
+    "How are you?",
+    "I am doing well, thank you for asking.",
+    "What is your name?",
+    "My name is {name}.",
+    "What can you do?",
+    "I can chat with you and answer basic questions.",
+    "Goodbye",
+    "Goodbye! Have a great day!",
+    "Thank you",
+    "You're welcome!",
+    "What time is it?",
+    "I can help you with time-related questions.",
+    "What is 2 + 2?",
+    "2 + 2 equals 4.",
+    "Help",
+    "I'm here to help! You can ask me questions and I'll do my best to respond.",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLAlchemy connect hook that tunes each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# SQLite's name for a private in-memory database rather than a file
+_MEMORY_DATABASE = ":memory:"
+
+# One pooled engine per database file, shared by every bot that opens it
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def _database_key(database_path: str) -> str:
+    """Normalize a database path so different spellings of one file compare equal."""
+    if database_path == _MEMORY_DATABASE:
+        return database_path
+    return os.path.abspath(database_path)
+
+
+def _get_engine(database_path: str):
+    """
+    Get the shared SQLAlchemy engine for a SQLite database file.
+    
+    Args:
+        database_path: Path to the SQLite database
+        
+    Returns:
+        Engine with a persistent connection pool and tuned pragmas
+    """
+    key = _database_key(database_path)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(
+                f'sqlite:///{database_path}',
+                poolclass=QueuePool,
+                connect_args={'check_same_thread': False}
+            )
+            event.listen(engine, 'connect', _set_sqlite_pragmas)
+            _engines[key] = engine
+        return engine
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_nltk_data():
+    """Make sure the NLTK tokenizer data used by ListTrainer is installed, once per process."""
+    import nltk
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        nltk.download("punkt_tab")
+
+
+def normalize_message(message: str) -> str:
+    """
+    Normalize a user message for use as a cache key.
+    
+    Args:
+        message: Input message from the user
+        
+    Returns:
+        Lowercased message with surrounding and repeated whitespace collapsed
+    """
+    return " ".join(message.lower().split())
+
+
+@functools.lru_cache(maxsize=None)
+def _rapidfuzz_comparison():
+    """
+    Build the rapidfuzz comparison class on first use.
+    
+    It subclasses a ChatterBot comparator, so defining it here keeps ChatterBot
+    (and the NLTK/spaCy stack it loads) out of this module's import time.
+    
+    Returns:
+        Comparison class to pass as statement_comparison_function
+    """
+    from chatterbot.comparisons import LevenshteinDistance
+    
+    class RapidFuzzLevenshteinDistance(LevenshteinDistance):
+        """
+        Faster approximation of ChatterBot's LevenshteinDistance comparison.
+        
+        ChatterBot scores every candidate statement with difflib.SequenceMatcher
+        (Ratcliff-Obershelp) in pure Python. rapidfuzz's fuzz.ratio is an
+        Indel (LCS-based) similarity computed in C. The two agree on most pairs
+        but not all: a small fraction score differently, occasionally on the
+        other side of the BestMatch threshold, so a borderline message can get
+        a different reply (or the default one) than with ChatterBot's scorer.
+        """
+        
+        def compare(self, statement_a, statement_b) -> float:
+            """
+            Compare two statements by the similarity of their lowercased text.
+            
+            Returns:
+                Similarity between 0 and 1, rounded to two decimal places
+            """
+            if not statement_a.text or not statement_b.text:
+                return 0
+            return round(fuzz.ratio(statement_a.text.lower(), statement_b.text.lower()) / 100, 2)
+    
+    return RapidFuzzLevenshteinDistance
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of chatbot responses keyed by normalized message.
+    
+    Prompts that differ only in case or spacing share an entry, so recurring
+    questions skip ChatterBot's statement search and storage round-trips.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of responses to keep; 0 disables caching
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Normalized message
+            
+        Returns:
+            Cached response string or None if not cached
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+    
+    def put(self, key: str, response: str):
+        """
+        Store a response, evicting the least recently used entry when full.
+        
+        Args:
+            key: Normalized message
+            response: Response string to cache
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class BasicChatBot:
     """
     A basic chatbot implementation using ChatterBot library.
@@ -21,40 +278,44 @@ class BasicChatBot:
     It can be trained with conversation data and responds based on pattern matching.
     """
     
-    def __init__(self, name: str = "NonLLMBot", database_path: str = "db.sqlite3"):
+    def __init__(self, name: str = "NonLLMBot", database_path: str = "db.sqlite3",
+                 cache_size: int = 256, read_only: bool = False):
         """
         Initialize the chatbot.
         
         Args:
             name: Name of the chatbot
             database_path: Path to the SQLite database for storing conversations
+            cache_size: Maximum number of cached responses (0 disables the cache)
+            read_only: Do not store conversation statements while responding, which
+                removes the per-message database write (training still writes)
         """
         self.name = name
         self.database_path = database_path
+        self.response_cache = ResponseCache(cache_size)
+        # Exact-match answers taken from the bot's own training pairs
+        self._faq = {}
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing BasicChatBot ...")
+        # Imported here rather than at module level: ChatterBot takes seconds to
+        # import and is not needed by callers that only use the cache helpers
+        from chatterbot import ChatBot
+        from chatterbot.trainers import ChatterBotCorpusTrainer, ListTrainer
+        
         # Initialize the chatbot
         self.bot = ChatBot(
             name,
             storage_adapter='chatterbot.storage.SQLStorageAdapter',
             database_uri=f'sqlite:///{database_path}',
-            logic_adapters=[
-                {
-                    'import_path': 'chatterbot.logic.BestMatch',
-                    'default_response': 'I am sorry, I do not understand. Could you please rephrase?',
-                    'maximum_similarity_threshold': 0.90
-                },
-                {
-                    'import_path': 'chatterbot.logic.MathematicalEvaluation',
-                },
-                {
-                    'import_path': 'chatterbot.logic.TimeLogicAdapter',
-                }
-            ]
+            read_only=read_only,
+            statement_comparison_function=_rapidfuzz_comparison(),
+            # ChatterBot pops keys from adapter dicts while loading them, so
+            # each bot gets its own copy of the shared configuration
+            logic_adapters=[dict(adapter) for adapter in _LOGIC_ADAPTERS]
         )
+        self._use_persistent_connections()
+        self._ensure_indexes()
         self.logger.info("Creating ChatterBotCorpusTrainer")
         self.trainer = ChatterBotCorpusTrainer(self.bot)
         self.logger.info("Creating ListTrainer")
@@ -62,6 +323,35 @@ class BasicChatBot:
         
         self.logger.info(f"Chatbot '{name}' initialized successfully")
     
+    def _use_persistent_connections(self):
+        """
+        Rebind the ChatterBot storage to an engine that keeps SQLite connections open.
+        
+        Before SQLAlchemy 2.0 a file-backed SQLite engine uses NullPool, so every
+        storage call (including the write made on each get_response) would
+        otherwise reconnect to the database file. Bots on the same file share
+        one engine and therefore one connection pool.
+        
+        An in-memory database only exists on the connection ChatterBot created
+        its tables on, so it keeps ChatterBot's own engine.
+        """
+        if self.database_path == _MEMORY_DATABASE:
+            return
+        storage = self.bot.storage
+        engine = _get_engine(self.database_path)
+        storage.engine.dispose()
+        storage.engine = engine
+        storage.Session = sessionmaker(bind=engine, expire_on_commit=True)
+    
+    def _ensure_indexes(self):
+        """Create the statement table indexes used by response lookups if missing."""
+        try:
+            with self.bot.storage.engine.begin() as connection:
+                for statement in _STATEMENT_INDEXES:
+                    connection.execute(text(statement))
+        except Exception as e:
+            self.logger.warning(f"Could not create statement indexes: {str(e)}")
+    
     def train_with_corpus(self, corpus_name: str = 'chatterbot.corpus.english'):
         """
         Train the chatbot with a predefined corpus.
@@ -72,23 +362,25 @@ class BasicChatBot:
         try:
             self.logger.info(f"Training chatbot with corpus: {corpus_name}")
             self.trainer.train(corpus_name)
+            self.response_cache.clear()
             self.logger.info("Training completed successfully")
         except Exception as e:
             self.logger.error(f"Error during corpus training: {str(e)}")
             raise
     
-    def train_with_conversations(self, conversations: List[str]):
+    def train_with_conversations(self, conversations: Sequence[str]):
         """
         Train the chatbot with custom conversation data.
         
         Args:
-            conversations: List of conversation strings
+            conversations: Sequence of conversation strings
         """
         try:
             self.logger.info("Training chatbot with custom conversations")
-            import nltk
-            nltk.download("punkt_tab")
+            _ensure_nltk_data()
             self.list_trainer.train(conversations)
+            self._remember_pairs(conversations)
+            self.response_cache.clear()
             self.logger.info("Custom training completed successfully")
         except Exception as e:
             self.logger.error(f"Error during custom training: {str(e)}")
@@ -105,44 +397,169 @@ class BasicChatBot:
             Response string from the chatbot
         """
         try:
-            self.logger.info(f"Processing message: {message}")
-            response = self.bot.get_response(message)
-            self.logger.info(f"Generated response: {response}")
-            return str(response)
+            key = normalize_message(message)
+            answer = self._faq.get(key)
+            if answer is not None:
+                return answer
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            self.logger.info("Processing message: %s", message)
+            reply = str(self.bot.get_response(message))
+            self.logger.info("Generated response: %s", reply)
+            if not reply.startswith(_TIME_RESPONSE_PREFIX):
+                self.response_cache.put(key, reply)
+            return reply
         except Exception as e:
-            self.logger.error(f"Error generating response: {str(e)}")
+            self.logger.error("Error generating response: %s", e)
             return "I'm sorry, I encountered an error processing your message."
     
-    def train_basic_conversations(self):
-        """Train the chatbot with basic conversation patterns."""
-        basic_conversations = [
-            "Hello",
-            "Hi there!",
-            "How are you?",
-            "I am doing well, thank you for asking.",
-            "What is your name?",
-            f"My name is {self.name}.",
-            "What can you do?",
-            "I can chat with you and answer basic questions.",
-            "Goodbye",
-            "Goodbye! Have a great day!",
-            "Thank you",
-            "You're welcome!",
-            "What time is it?",
-            "I can help you with time-related questions.",
-            "What is 2 + 2?",
-            "2 + 2 equals 4.",
-            "Help",
-            "I'm here to help! You can ask me questions and I'll do my best to respond.",
-        ]
-        
-        self.train_with_conversations(basic_conversations)
+    def get_responses(self, messages: List[str]) -> List[str]:
+        """
+        Get responses for a batch of messages.
+        
+        Repeated messages within the batch are answered once and share the reply.
+        
+        Args:
+            messages: Input messages from the user
+        
+        Returns:
+            List of response strings in the same order as the messages
+        """
+        replies = {}
+        responses = []
+        for message in messages:
+            if message not in replies:
+                replies[message] = self.get_response(message)
+            responses.append(replies[message])
+        return responses
+    
+    def _remember_pairs(self, conversations: Sequence[str]):
+        """
+        Record each trained statement's reply for exact-match lookups.
+        
+        Args:
+            conversations: Sequence of conversation strings, each answered by the next
+        """
+        for question, answer in zip(conversations, conversations[1:]):
+            self._faq.setdefault(normalize_message(question), answer)
+    
+    def is_trained(self) -> bool:
+        """
+        Check whether the chatbot's database already holds trained statements.
+        
+        Returns:
+            True if the storage contains at least one statement
+        """
+        return self.bot.storage.count() > 0
+    
+    def _claim_training(self, step: str,
+                        lease: float = _TRAINING_CLAIM_LEASE) -> Optional[str]:
+        """
+        Claim a one-time training step in the bot's database.
+        
+        A claim older than the lease was left by a run that died mid-training
+        and is taken over, so the step is retried; a live claim is respected.
+        
+        Args:
+            step: Name of the training step
+            lease: Seconds after which another run's claim is considered stale
+            
+        Returns:
+            Owner token to pass to _finish_training if this call made the claim,
+            or None if another run holds it or has already trained the step
+        """
+        owner = uuid.uuid4().hex
+        now = time.time()
+        with self.bot.storage.engine.begin() as connection:
+            connection.execute(text(_TRAINING_META_TABLE))
+            connection.execute(
+                text("DELETE FROM training_meta WHERE k = :k AND v = 'claimed' "
+                     "AND claimed_at < :expired"),
+                {'k': step, 'expired': now - lease}
+            )
+            result = connection.execute(
+                text("INSERT OR IGNORE INTO training_meta (k, v, owner, claimed_at) "
+                     "VALUES (:k, 'claimed', :owner, :now)"),
+                {'k': step, 'owner': owner, 'now': now}
+            )
+            return owner if result.rowcount == 1 else None
+    
+    def _finish_training(self, step: str, owner: str, trained: bool):
+        """
+        Settle a claim made by _claim_training.
+        
+        Nothing changes if the claim has since been taken over by another run.
+        
+        Args:
+            step: Name of the training step
+            owner: Owner token returned by _claim_training
+            trained: True to record the step as trained, False to release the
+                claim so that a later run retries the step
+        """
+        if trained:
+            statement = "UPDATE training_meta SET v = 'trained' WHERE k = :k AND owner = :owner"
+        else:
+            statement = "DELETE FROM training_meta WHERE k = :k AND owner = :owner"
+        with self.bot.storage.engine.begin() as connection:
+            connection.execute(text(statement), {'k': step, 'owner': owner})
+    
+    def prewarm(self):
+        """
+        Run ChatterBot's lazy setup before the first real request.
+        
+        The throwaway message goes straight to ChatterBot, past the exact-match
+        table and response cache, and storage writes are switched off so it
+        does not leave a learned statement behind. Call this before the bot
+        starts serving requests.
+        """
+        read_only = self.bot.read_only
+        self.bot.read_only = True
+        try:
+            self.bot.get_response(_PREWARM_MESSAGE)
+        except Exception as e:
+            self.logger.warning("Could not prewarm chatbot: %s", e)
+        finally:
+            self.bot.read_only = read_only
+    
+    def train_basic_conversations(self, skip_if_trained: bool = False):
+        """
+        Train the chatbot with basic conversation patterns.
+        
+        Args:
+            skip_if_trained: Skip training when the database persisted from a
+                previous run already contains statements, or when another
+                process starting on the same database has claimed the training
+        """
+        basic_conversations = tuple(line.format(name=self.name) for line in _BASIC_CONVERSATIONS)
+        
+        if not skip_if_trained:
+            self.train_with_conversations(basic_conversations)
+            return
+        
+        owner = None if self.is_trained() else self._claim_training("basic_conversations")
+        if owner is None:
+            self.logger.info(f"Database '{self.database_path}' already trained, skipping basic training")
+            self._remember_pairs(basic_conversations)
+            return
+        
+        try:
+            self.train_with_conversations(basic_conversations)
+        except Exception:
+            self._finish_training("basic_conversations", owner, trained=False)
+            raise
+        self._finish_training("basic_conversations", owner, trained=True)
     
     def cleanup(self):
         """Clean up resources."""
         try:
             if hasattr(self.bot, 'storage'):
                 self.bot.storage.drop()
+                with self.bot.storage.engine.begin() as connection:
+                    connection.execute(text("DROP TABLE IF EXISTS training_meta"))
+            self._faq.clear()
+            self.response_cache.clear()
             self.logger.info("Chatbot cleanup completed")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {str(e)}")
@@ -156,12 +573,18 @@ class ChatBotManager:
     def __init__(self):
         """Initialize the chatbot manager."""
         self.bots = {}
+        # Bumped whenever the set of bots changes, so callers can cache views of it
+        self.version = 0
+        # Live bots by database path, so recreating a bot on a database that is
+        # still open reuses its ChatterBot instance instead of rebuilding
+        # engines and adapters
+        self._bots_by_path = weakref.WeakValueDictionary()
         self.logger = logging.getLogger(__name__)
         self.logger.info("ChatBotManager initialized")
     
     def create_bot(self, name: str, database_path: Optional[str] = None) -> BasicChatBot:
         """
-        Create a new chatbot instance.
+        Create a new chatbot instance and register it under its name.
         
         Args:
             name: Name of the chatbot
@@ -169,16 +592,93 @@ class ChatBotManager:
             
         Returns:
             BasicChatBot instance
+            
+        Raises:
+            ValueError: If a registered bot with another name uses the database
         """
         self.logger.info("Enter create_bot")
-        if database_path is None:
-            database_path = f"{name.lower()}_db.sqlite3"
-        self.logger.info(f"Creating bot '{name}' with database at '{database_path}'")
-        bot = BasicChatBot(name, database_path)
-        self.logger.info(f"Created bot '{name}'")
+        bot = self.build_bot(name, database_path)
+        self.add_bot(name, bot)
+        return bot
+    
+    def build_bot(self, name: str, database_path: Optional[str] = None) -> BasicChatBot:
+        """
+        Create a chatbot instance without registering it.
+        
+        If a live bot with the same name already uses the database path it is
+        reused rather than constructing a second ChatterBot instance on that
+        database. Register the bot with add_bot once it is ready to serve.
+        
+        Args:
+            name: Name of the chatbot
+            database_path: Optional custom database path
+            
+        Returns:
+            BasicChatBot instance
+            
+        Raises:
+            ValueError: If a registered bot with another name uses the database
+        """
+        database_path = self.database_path_for(name, database_path)
+        owner = self.get_bot_for_database(database_path)
+        if owner is not None and owner.name != name:
+            raise ValueError(
+                f"Database '{database_path}' is already used by bot '{owner.name}'"
+            )
+        key = _database_key(database_path)
+        bot = self._bots_by_path.get(key)
+        if bot is None or bot.name != name:
+            self.logger.info(f"Creating bot '{name}' with database at '{database_path}'")
+            bot = BasicChatBot(name, database_path)
+            # Every in-memory database is private to its bot, so it is never shared
+            if key != _MEMORY_DATABASE:
+                self._bots_by_path[key] = bot
+            self.logger.info(f"Created bot '{name}'")
+        else:
+            self.logger.info(f"Reusing bot for database at '{database_path}' as '{name}'")
+        return bot
+    
+    def add_bot(self, name: str, bot: BasicChatBot):
+        """
+        Register a chatbot so that it can be looked up by name.
+        
+        Args:
+            name: Name of the chatbot
+            bot: BasicChatBot instance, usually from build_bot
+        """
         self.bots[name] = bot
+        self.version += 1
         self.logger.info(f"Created chatbot: {name}")
-        return bot
+    
+    def database_path_for(self, name: str, database_path: Optional[str] = None) -> str:
+        """
+        Resolve the database path a bot uses.
+        
+        Args:
+            name: Name of the chatbot
+            database_path: Optional custom database path
+            
+        Returns:
+            The custom path if given, otherwise the default path derived from the name
+        """
+        if database_path is not None:
+            return database_path
+        return f"{name.lower()}_db.sqlite3"
+    
+    def get_bot_for_database(self, database_path: str) -> Optional[BasicChatBot]:
+        """
+        Get the registered chatbot that uses a database file, if any.
+        
+        Args:
+            database_path: Path to the SQLite database
+            
+        Returns:
+            BasicChatBot instance or None if no registered bot uses the file
+        """
+        bot = self._bots_by_path.get(_database_key(database_path))
+        if bot is not None and any(other is bot for other in self.bots.values()):
+            return bot
+        return None
     
     def get_bot(self, name: str) -> Optional[BasicChatBot]:
         """
@@ -203,8 +703,11 @@ class ChatBotManager:
             True if removed successfully, False if not found
         """
         if name in self.bots:
-            self.bots[name].cleanup()
-            del self.bots[name]
+            bot = self.bots.pop(name)
+            self.version += 1
+            # Only drop the storage once no other name shares this bot
+            if not any(other is bot for other in self.bots.values()):
+                bot.cleanup()
             self.logger.info(f"Removed chatbot: {name}")
             return True
         return False
@@ -3,20 +3,97 @@ Flask web application for the non-LLM chatbot.
 Provides REST API endpoints for chatbot interaction.
 """
 
-from flask import Flask, request, jsonify, render_template_string
-from chatbot import BasicChatBot, ChatBotManager
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import gzip
+import hashlib
 import logging
-import sys
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Union
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if __package__:
+    from .chatbot import BasicChatBot, ChatBotManager
+else:  # imported by main.py run as a script
+    from chatbot import BasicChatBot, ChatBotManager
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson has no PyPy build; fall back to the stdlib encoder
+    import json
+    
+    def _json_dumps(obj: Any, default=None) -> bytes:
+        return json.dumps(obj, default=default, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8")
+    
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for MessagePack clients of /api/chat
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # optional: the chat page is then offered gzip only
+    brotli = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # optional: API responses are then sent uncompressed
+    Compress = None
+
+# The chat page has no template variables, so it is read and compressed once
+# at import and served as-is instead of going through Jinja on every request.
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+with open(os.path.join(_STATIC_DIR, "index.html"), "rb") as _index_file:
+    _CHAT_TEMPLATE_BYTES = _index_file.read()
+_CHAT_TEMPLATE_GZIP = gzip.compress(_CHAT_TEMPLATE_BYTES, compresslevel=9)
+_CHAT_TEMPLATE_BR = brotli.compress(_CHAT_TEMPLATE_BYTES, quality=11) if brotli else None
+# Precompressed variants of the page in order of preference
+_CHAT_TEMPLATE_ENCODINGS = tuple(
+    (encoding, body)
+    for encoding, body in (("br", _CHAT_TEMPLATE_BR), ("gzip", _CHAT_TEMPLATE_GZIP))
+    if body is not None
+)
+_CHAT_ETAG = hashlib.sha256(_CHAT_TEMPLATE_BYTES).hexdigest()[:16]
+
+_MSGPACK_MIMETYPE = "application/msgpack"
+
+# Load balancers poll /health constantly; its body never changes
+_HEALTH_BYTES = _json_dumps({"status": "healthy", "service": "non-llm-chatbot"})
+# /ready body while the default bot is still loading
+_STARTING_BYTES = _json_dumps({"status": "starting", "service": "non-llm-chatbot"})
+
+# Fixed error bodies, serialized once rather than on every failing request
+_MISSING_MESSAGE_BYTES = _json_dumps({"error": "Missing 'message' in request body", "status": "error"})
+_SERVER_BUSY_BYTES = _json_dumps({"error": "Server busy, please try again", "status": "error"})
+_INTERNAL_ERROR_BYTES = _json_dumps({"error": "Internal server error", "status": "error"})
+_MISSING_MESSAGES_BYTES = _json_dumps({"error": "Missing 'messages' list of strings in request body", "status": "error"})
+_MISSING_NAME_BYTES = _json_dumps({"error": "Missing 'name' in request body", "status": "error"})
+_MISSING_TRAINING_DATA_BYTES = _json_dumps({"error": "Missing 'bot_name' or 'conversations' in request body", "status": "error"})
+_INVALID_CONVERSATIONS_BYTES = _json_dumps({"error": "'conversations' must be a non-empty list of strings", "status": "error"})
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson (when installed) instead of the stdlib json module."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return _json_dumps(obj, default=self.default).decode("utf-8")
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return _json_loads(s)
 
 
 class ChatBotFlaskApp:
     """Flask application wrapper for the chatbot."""
     
-    def __init__(self, host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
+    def __init__(self, host: str = "0.0.0.0", port: int = 5000, debug: bool = False,
+                 max_concurrent_chats: int = 8, queue_timeout: float = 5.0,
+                 server_threads: int = 16, runtime: str = "sync",
+                 max_batch_size: int = 32):
         """
         Initialize the Flask application.
         
@@ -24,36 +101,141 @@ class ChatBotFlaskApp:
             host: Host address to bind to
             port: Port number to bind to
             debug: Enable debug mode
+            max_concurrent_chats: Maximum number of chat requests processed at once
+            queue_timeout: Seconds a chat request may wait for a free slot before
+                being rejected with 503
+            server_threads: Worker threads for the production (waitress) server
+            runtime: "sync" to serve with threads, or "gevent" to serve with the
+                gevent WSGI server (the caller must monkey-patch first)
+            max_batch_size: Maximum number of messages accepted by /api/chat/batch,
+                which answers the whole batch in a single chat slot
         """
         self.app = Flask(__name__)
+        self.app.json = ORJSONProvider(self.app)
+        if Compress is not None:
+            # Compress larger API responses; the chat page is precompressed above
+            self.app.config.setdefault("COMPRESS_ALGORITHM", ["br", "gzip"])
+            self.app.config.setdefault("COMPRESS_BR_LEVEL", 4)
+            self.app.config.setdefault("COMPRESS_MIN_SIZE", 512)
+            Compress(self.app)
         self.host = host
         self.port = port
         self.debug = debug
+        # Apply the flag to the Flask app itself too, so it also holds when the
+        # app is served by a WSGI server and run() is never called
+        self.app.debug = debug
+        self.queue_timeout = queue_timeout
+        self.max_batch_size = max_batch_size
+        self.server_threads = server_threads
+        self.runtime = runtime
+        # Admission control: excess chat requests wait briefly, then get a 503
+        # instead of piling onto the bots and slowing every client down.
+        self._chat_slots = threading.BoundedSemaphore(max_concurrent_chats)
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         self.logger.info("Creating bot manager")
         # Initialize chatbot manager
         self.bot_manager = ChatBotManager()
         self.logger.info("Bot manager created")
-        # Create default chatbot
-        self.default_bot = self.bot_manager.create_bot("DefaultBot")
-        self.logger.info("Created default bot")
-        self.default_bot.train_basic_conversations()
-        self.logger.info("Default bot trained with basic conversations")
+        # The default chatbot is created and trained on first use so that
+        # constructing the app (and binding the server) stays fast.
+        self._default_bot = None
+        self._default_bot_lock = threading.Lock()
+        # Background training requested through /api/train. Queued jobs run one
+        # at a time, in order; synchronous training runs alongside them.
+        self._training_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-training")
+        self._training_jobs = set()
+        self._training_jobs_lock = threading.Lock()
+        # Failure of the most recently finished background job, reported on /ready
+        self._last_training_error = None
+        # Serialized /api/bots body and the bot_manager.version it was built from
+        self._bots_body = (None, b"")
         # Set up routes
         self._setup_routes()
         self.logger.info("Set up routes")
+        # Build the default bot in the background; /ready reports when it is done
+        threading.Thread(target=self._warm_default_bot, name="default-bot-warmup", daemon=True).start()
         self.logger.info("Flask chatbot application initialized")
     
+    @property
+    def default_bot(self) -> BasicChatBot:
+        """
+        Get the default chatbot, creating and training it on first use.
+        
+        If building the bot fails nothing is registered or remembered, so the
+        next access (e.g. the next chat request) retries the whole build.
+        """
+        if self._default_bot is None:
+            with self._default_bot_lock:
+                if self._default_bot is None:
+                    bot = self.bot_manager.get_bot("DefaultBot")
+                    if bot is None:
+                        # Registered only once trained and prewarmed, so no
+                        # request can reach the bot while it is being built
+                        bot = self.bot_manager.build_bot("DefaultBot")
+                        self.logger.info("Created default bot")
+                        # Reuse the database trained by a previous run when present
+                        bot.train_basic_conversations(skip_if_trained=True)
+                        self.logger.info("Default bot trained with basic conversations")
+                        bot.prewarm()
+                        self.bot_manager.add_bot("DefaultBot", bot)
+                    self._default_bot = bot
+        return self._default_bot
+    
+    def _resolve_bot(self, bot_name: str):
+        """
+        Get the bot a chat request asked for, falling back to the default bot.
+        
+        The default bot is always reached through the default_bot property,
+        which waits for it to finish training rather than serving it early.
+        
+        Args:
+            bot_name: Requested bot name
+            
+        Returns:
+            Tuple of the name actually used and the BasicChatBot instance
+        """
+        bot = None if bot_name == "DefaultBot" else self.bot_manager.get_bot(bot_name)
+        if bot is None:
+            return "DefaultBot", self.default_bot
+        return bot_name, bot
+    
+    def _warm_default_bot(self):
+        """Create the default chatbot ahead of the first chat request."""
+        try:
+            self.default_bot
+        except Exception as e:
+            self.logger.error("Error warming default bot, will retry on first use: %s", e)
+    
     def _setup_routes(self):
         """Set up Flask routes."""
         
         @self.app.route('/')
         def index():
             """Serve the main chat interface."""
-            return render_template_string(self._get_chat_template())
+            encoding, body = next(
+                ((encoding, body) for encoding, body in _CHAT_TEMPLATE_ENCODINGS
+                 if request.accept_encodings.quality(encoding) > 0),
+                (None, _CHAT_TEMPLATE_BYTES)
+            )
+            # Each encoding is a distinct representation, so it gets its own ETag
+            etag = f"{_CHAT_ETAG}-{encoding}" if encoding else _CHAT_ETAG
+            headers = {
+                "Cache-Control": "public, max-age=3600",
+                "Vary": "Accept-Encoding",
+                "ETag": f'"{etag}"',
+            }
+            if request.if_none_match.contains_weak(etag):
+                return Response(status=304, headers=headers)
+            if encoding:
+                headers["Content-Encoding"] = encoding
+            response = Response(body, mimetype="text/html", headers=headers)
+            # The body is final bytes, so let Werkzeug hand it to the server as-is.
+            # This does not stop Flask-Compress (it resets direct_passthrough);
+            # the Content-Encoding header set above does, and a client that
+            # accepts neither br nor gzip negotiates no algorithm for it to use.
+            response.direct_passthrough = True
+            return response
         
         @self.app.route('/api/chat', methods=['POST'])
         def chat():
@@ -66,6 +248,9 @@ class ChatBotFlaskApp:
                 "bot_name": "optional bot name"
             }
             
+            The body may also be MessagePack (Content-Type: application/msgpack),
+            and the reply is MessagePack when the client prefers it in Accept.
+            
             Returns:
             {
                 "response": "bot response",
@@ -74,38 +259,93 @@ class ChatBotFlaskApp:
             }
             """
             try:
-                data = request.get_json()
+                data = self._load(allow_msgpack=True)
                 
                 if not data or 'message' not in data:
-                    return jsonify({
-                        "error": "Missing 'message' in request body",
-                        "status": "error"
-                    }), 400
+                    return self._negotiate(_MISSING_MESSAGE_BYTES, 400)
                 
                 message = data['message']
                 bot_name = data.get('bot_name', 'DefaultBot')
                 
-                # Get the specified bot or use default
-                bot = self.bot_manager.get_bot(bot_name)
-                if bot is None:
-                    bot = self.default_bot
-                    bot_name = "DefaultBot"
+                bot_name, bot = self._resolve_bot(bot_name)
+                
+                # Get response from bot once a processing slot is free
+                if not self._chat_slots.acquire(timeout=self.queue_timeout):
+                    return self._negotiate(_SERVER_BUSY_BYTES, 503)
+                try:
+                    response = bot.get_response(message)
+                finally:
+                    self._chat_slots.release()
                 
-                # Get response from bot
-                response = bot.get_response(message)
+                if self._wants_msgpack():
+                    return self._negotiate({
+                        "response": response,
+                        "bot_name": bot_name,
+                        "status": "success"
+                    })
+                # Splice the two strings into the fixed envelope rather than
+                # building and serializing a dict on every chat turn
+                return Response(b"".join((
+                    b'{"response":', _json_dumps(response),
+                    b',"bot_name":', _json_dumps(bot_name),
+                    b',"status":"success"}'
+                )), mimetype="application/json")
+                
+            except Exception as e:
+                self.logger.error("Error in chat endpoint: %s", e)
+                return self._negotiate(_INTERNAL_ERROR_BYTES, 500)
+        
+        @self.app.route('/api/chat/batch', methods=['POST'])
+        def chat_batch():
+            """
+            Batch chat endpoint for sending several messages in one request.
+            
+            Expected JSON payload:
+            {
+                "messages": ["message1", "message2", ...],
+                "bot_name": "optional bot name"
+            }
+            
+            Returns:
+            {
+                "responses": ["response1", "response2", ...],
+                "bot_name": "bot name used",
+                "status": "success"
+            }
+            """
+            try:
+                data = self._load(allow_msgpack=True)
                 
-                return jsonify({
-                    "response": response,
+                messages = data.get('messages') if isinstance(data, dict) else None
+                if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+                    return self._negotiate(_MISSING_MESSAGES_BYTES, 400)
+                if len(messages) > self.max_batch_size:
+                    return self._negotiate({
+                        "error": f"Too many messages in batch (maximum {self.max_batch_size})",
+                        "status": "error"
+                    }, 413)
+                
+                bot_name = data.get('bot_name', 'DefaultBot')
+                
+                bot_name, bot = self._resolve_bot(bot_name)
+                
+                # The whole batch holds a single processing slot
+                if not self._chat_slots.acquire(timeout=self.queue_timeout):
+                    return self._negotiate(_SERVER_BUSY_BYTES, 503)
+                try:
+                    responses = bot.get_responses(messages)
+                finally:
+                    self._chat_slots.release()
+                
+                return self._negotiate({
+                    "responses": responses,
                     "bot_name": bot_name,
                     "status": "success"
                 })
                 
             except Exception as e:
-                self.logger.error(f"Error in chat endpoint: {str(e)}")
-                return jsonify({
-                    "error": "Internal server error",
-                    "status": "error"
-                }), 500
+                self.logger.error("Error in batch chat endpoint: %s", e)
+                return self._negotiate(_INTERNAL_ERROR_BYTES, 500)
         
         @self.app.route('/api/bots', methods=['GET'])
         def list_bots():
@@ -119,17 +359,18 @@ class ChatBotFlaskApp:
             }
             """
             try:
-                bots = self.bot_manager.list_bots()
-                return jsonify({
-                    "bots": bots,
-                    "status": "success"
-                })
+                version, body = self._bots_body
+                if version != self.bot_manager.version:
+                    version = self.bot_manager.version
+                    body = _json_dumps({
+                        "bots": self.bot_manager.list_bots(),
+                        "status": "success"
+                    })
+                    self._bots_body = (version, body)
+                return Response(body, mimetype="application/json")
             except Exception as e:
-                self.logger.error(f"Error listing bots: {str(e)}")
-                return jsonify({
-                    "error": "Internal server error",
-                    "status": "error"
-                }), 500
+                self.logger.error("Error listing bots: %s", e)
+                return self._json(_INTERNAL_ERROR_BYTES, 500)
         
         @self.app.route('/api/bots', methods=['POST'])
         def create_bot():
@@ -150,23 +391,29 @@ class ChatBotFlaskApp:
             }
             """
             try:
-                data = request.get_json()
+                data = self._load()
                 
                 if not data or 'name' not in data:
-                    return jsonify({
-                        "error": "Missing 'name' in request body",
-                        "status": "error"
-                    }), 400
+                    return self._json(_MISSING_NAME_BYTES, 400)
                 
                 bot_name = data['name']
                 train_basic = data.get('train_basic', True)
                 
                 # Check if bot already exists
                 if self.bot_manager.get_bot(bot_name):
-                    return jsonify({
+                    return self._json({
                         "error": f"Bot '{bot_name}' already exists",
                         "status": "error"
-                    }), 400
+                    }, 400)
+                
+                # create_bot refuses names that map to an existing bot's database
+                # file (e.g. differing only in case); report that as a bad request
+                database_path = self.bot_manager.database_path_for(bot_name)
+                if self.bot_manager.get_bot_for_database(database_path) is not None:
+                    return self._json({
+                        "error": f"Bot '{bot_name}' would share its database with an existing bot",
+                        "status": "error"
+                    }, 400)
                 
                 # Create new bot
                 new_bot = self.bot_manager.create_bot(bot_name)
@@ -174,18 +421,15 @@ class ChatBotFlaskApp:
                 if train_basic:
                     new_bot.train_basic_conversations()
                 
-                return jsonify({
+                return self._json({
                     "message": "Bot created successfully",
                     "bot_name": bot_name,
                     "status": "success"
                 })
                 
             except Exception as e:
-                self.logger.error(f"Error creating bot: {str(e)}")
-                return jsonify({
-                    "error": "Internal server error",
-                    "status": "error"
-                }), 500
+                self.logger.error("Error creating bot: %s", e)
+                return self._json(_INTERNAL_ERROR_BYTES, 500)
         
         @self.app.route('/api/train', methods=['POST'])
         def train_bot():
@@ -195,9 +439,13 @@ class ChatBotFlaskApp:
             Expected JSON payload:
             {
                 "bot_name": "bot name",
-                "conversations": ["message1", "response1", "message2", "response2", ...]
+                "conversations": ["message1", "response1", "message2", "response2", ...],
+                "background": false (optional)
             }
             
+            With "background": true training is queued and the endpoint returns
+            202 immediately; /ready reports it as in progress until it finishes.
+            
             Returns:
             {
                 "message": "Training completed successfully",
@@ -205,198 +453,168 @@ class ChatBotFlaskApp:
             }
             """
             try:
-                data = request.get_json()
+                data = self._load()
                 
                 if not data or 'bot_name' not in data or 'conversations' not in data:
-                    return jsonify({
-                        "error": "Missing 'bot_name' or 'conversations' in request body",
-                        "status": "error"
-                    }), 400
+                    return self._json(_MISSING_TRAINING_DATA_BYTES, 400)
                 
                 bot_name = data['bot_name']
                 conversations = data['conversations']
+                if (not isinstance(conversations, list) or not conversations
+                        or not all(isinstance(c, str) for c in conversations)):
+                    return self._json(_INVALID_CONVERSATIONS_BYTES, 400)
                 
                 # Get the bot
                 bot = self.bot_manager.get_bot(bot_name)
                 if bot is None:
-                    return jsonify({
+                    return self._json({
                         "error": f"Bot '{bot_name}' not found",
                         "status": "error"
-                    }), 404
+                    }, 404)
+                
+                if data.get('background', False):
+                    self._train_in_background(bot_name, bot, conversations)
+                    return self._json({
+                        "message": "Training started",
+                        "status": "accepted"
+                    }, 202)
                 
                 # Train the bot
                 bot.train_with_conversations(conversations)
                 
-                return jsonify({
+                return self._json({
                     "message": "Training completed successfully",
                     "status": "success"
                 })
                 
             except Exception as e:
-                self.logger.error(f"Error training bot: {str(e)}")
-                return jsonify({
-                    "error": "Internal server error",
-                    "status": "error"
-                }), 500
+                self.logger.error("Error training bot: %s", e)
+                return self._json(_INTERNAL_ERROR_BYTES, 500)
         
         @self.app.route('/health', methods=['GET'])
         def health_check():
             """Health check endpoint."""
-            return jsonify({
-                "status": "healthy",
+            return Response(_HEALTH_BYTES, mimetype="application/json",
+                            headers={"Cache-Control": "no-store"})
+        
+        @self.app.route('/ready', methods=['GET'])
+        def readiness_check():
+            """Readiness endpoint; returns 503 until the default bot is loaded."""
+            if self._default_bot is None:
+                return self._json(_STARTING_BYTES, 503)
+            payload = {
+                "status": "ready",
                 "service": "non-llm-chatbot"
-            })
+            }
+            if self._training_jobs:
+                payload["training"] = "in_progress"
+            if self._last_training_error is not None:
+                payload["last_training_error"] = self._last_training_error
+            return self._json(payload)
     
-    def _get_chat_template(self) -> str:
-        """Get the HTML template for the chat interface."""
-        return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Non-LLM Chatbot</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .chat-container {
-            background-color: white;
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        .chat-messages {
-            height: 400px;
-            overflow-y: auto;
-            border: 1px solid #ddd;
-            padding: 10px;
-            margin-bottom: 20px;
-            background-color: #fafafa;
-        }
-        .message {
-            margin-bottom: 10px;
-            padding: 8px 12px;
-            border-radius: 18px;
-            max-width: 70%;
-        }
-        .user-message {
-            background-color: #007bff;
-            color: white;
-            margin-left: auto;
-            text-align: right;
-        }
-        .bot-message {
-            background-color: #e9ecef;
-            color: #333;
-        }
-        .input-container {
-            display: flex;
-            gap: 10px;
-        }
-        #messageInput {
-            flex: 1;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }
-        #sendButton {
-            padding: 10px 20px;
-            background-color: #007bff;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-        }
-        #sendButton:hover {
-            background-color: #0056b3;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 20px;
-        }
-    </style>
-</head>
-<body>
-    <div class="chat-container">
-        <div class="header">
-            <h1>Non-LLM Chatbot</h1>
-            <p>Chat with our basic pattern-matching chatbot!</p>
-        </div>
+    def _train_in_background(self, bot_name: str, bot: BasicChatBot, conversations):
+        """
+        Queue custom training for a bot on the background training thread.
         
-        <div id="chatMessages" class="chat-messages">
-            <div class="message bot-message">
-                Hello! I'm a non-LLM chatbot. How can I help you today?
-            </div>
-        </div>
+        Args:
+            bot_name: Name the bot was requested under
+            bot: Bot to train
+            conversations: List of conversation strings
+        """
+        future = self._training_executor.submit(bot.train_with_conversations, conversations)
+        with self._training_jobs_lock:
+            self._training_jobs.add(future)
+        future.add_done_callback(functools.partial(self._finish_training_job, bot_name))
+    
+    def _finish_training_job(self, bot_name: str, future):
+        """Forget a finished background training job and record its outcome."""
+        error = future.exception()
+        if error is not None:
+            self.logger.error("Background training of bot '%s' failed: %s", bot_name, error)
+        with self._training_jobs_lock:
+            self._training_jobs.discard(future)
+            self._last_training_error = (
+                None if error is None else {"bot_name": bot_name, "error": str(error)}
+            )
+    
+    def _load(self, allow_msgpack: bool = False) -> Any:
+        """
+        Parse the request body as JSON.
         
-        <div class="input-container">
-            <input type="text" id="messageInput" placeholder="Type your message here..." onkeypress="handleKeyPress(event)">
-            <button id="sendButton" onclick="sendMessage()">Send</button>
-        </div>
-    </div>
-
-    <script>
-        function addMessage(message, isUser) {
-            const messagesDiv = document.getElementById('chatMessages');
-            const messageDiv = document.createElement('div');
-            messageDiv.className = `message ${isUser ? 'user-message' : 'bot-message'}`;
-            messageDiv.textContent = message;
-            messagesDiv.appendChild(messageDiv);
-            messagesDiv.scrollTop = messagesDiv.scrollHeight;
-        }
-
-        async function sendMessage() {
-            const input = document.getElementById('messageInput');
-            const message = input.value.trim();
-            
-            if (!message) return;
+        Args:
+            allow_msgpack: Decode MessagePack bodies sent as application/msgpack
+                (requires the optional msgpack package)
+        
+        Returns:
+            Decoded payload, or None if the body is empty or not valid
+        """
+        raw = request.get_data(cache=False)
+        if not raw:
+            return None
+        if allow_msgpack and msgpack is not None and request.mimetype == _MSGPACK_MIMETYPE:
+            try:
+                return msgpack.unpackb(raw, raw=False)
+            except ValueError:
+                return None
+        try:
+            return _json_loads(raw)
+        except ValueError:
+            return None
+    
+    def _json(self, payload: Union[Dict[str, Any], bytes], status: int = 200) -> Response:
+        """
+        Build a JSON response serialized directly to bytes.
+        
+        Args:
+            payload: Response body, or an already serialized JSON body
+            status: HTTP status code
             
-            // Add user message to chat
-            addMessage(message, true);
-            input.value = '';
+        Returns:
+            Flask Response with an application/json body
+        """
+        body = payload if isinstance(payload, bytes) else _json_dumps(payload)
+        return Response(body, status=status, mimetype="application/json")
+    
+    def _wants_msgpack(self) -> bool:
+        """Check whether the client prefers a MessagePack reply over JSON."""
+        return msgpack is not None and request.accept_mimetypes.best_match(
+            ["application/json", _MSGPACK_MIMETYPE]) == _MSGPACK_MIMETYPE
+    
+    def _negotiate(self, payload: Union[Dict[str, Any], bytes], status: int = 200) -> Response:
+        """
+        Build a JSON or MessagePack response, whichever the client prefers.
+        
+        JSON wins ties (e.g. Accept: */*), so browsers keep getting JSON.
+        
+        Args:
+            payload: Response body, or an already serialized JSON body
+            status: HTTP status code
             
-            try {
-                const response = await fetch('/api/chat', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({
-                        message: message
-                    })
-                });
-                
-                const data = await response.json();
-                
-                if (data.status === 'success') {
-                    addMessage(data.response, false);
-                } else {
-                    addMessage('Sorry, I encountered an error. Please try again.', false);
-                }
-            } catch (error) {
-                console.error('Error:', error);
-                addMessage('Sorry, I encountered an error. Please try again.', false);
-            }
-        }
-
-        function handleKeyPress(event) {
-            if (event.key === 'Enter') {
-                sendMessage();
-            }
-        }
-    </script>
-</body>
-</html>
+        Returns:
+            Flask Response
         """
+        if self._wants_msgpack():
+            if isinstance(payload, bytes):
+                payload = _json_loads(payload)
+            return Response(msgpack.packb(payload, use_bin_type=True), status=status,
+                            mimetype=_MSGPACK_MIMETYPE)
+        return self._json(payload, status)
     
     def run(self):
         """Run the Flask application."""
-        self.logger.info(f"Starting Flask app on {self.host}:{self.port}")
+        self.logger.info("Starting Flask app on %s:%s", self.host, self.port)
+        if self.runtime == "gevent":
+            from gevent.pywsgi import WSGIServer
+            WSGIServer((self.host, self.port), self.app).serve_forever()
+            return
+        if not self.debug:
+            try:
+                from waitress import serve
+            except ImportError:
+                self.logger.warning("waitress is not installed; using the Flask development server")
+            else:
+                serve(self.app, host=self.host, port=self.port, threads=self.server_threads)
+                return
         self.app.run(host=self.host, port=self.port, debug=self.debug)
     
     def get_app(self):
@@ -408,8 +626,16 @@ def create_app() -> Flask:
     """
     Factory function to create a Flask application instance.
     
+    Flask debug mode (app.debug) is set from the FLASK_DEBUG environment
+    variable ("1" or "true"). The reloader and interactive debugger are never
+    enabled here; they only run under run() with --debug.
+    
     Returns:
         Flask application instance
     """
-    chatbot_app = ChatBotFlaskApp(debug=True)
+    # Give standalone factory use (e.g. under a WSGI server) INFO logs; this is
+    # a no-op when the host process has already configured logging.
+    logging.basicConfig(level=logging.INFO)
+    debug = os.environ.get("FLASK_DEBUG", "").lower() in ("1", "true")
+    chatbot_app = ChatBotFlaskApp(debug=debug)
     return chatbot_app.get_app()
\ No newline at end of file
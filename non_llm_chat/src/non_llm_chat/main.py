@@ -4,17 +4,17 @@ This module provides the main function that can be executed from the command lin
 or used as an entry point for Databricks Asset Bundle jobs.
 """
 
-import argparse
 import logging
 import sys
 import os
 from typing import Optional
-# Add the current directory to Python path for imports
-#sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from flask_app import ChatBotFlaskApp
-from chatbot import BasicChatBot, ChatBotManager
+# flask_app and chatbot are imported inside the run functions so that
+# --runtime gevent can monkey-patch the standard library before Flask loads.
+# They are sibling modules when main runs as a script (python main.py) and
+# package modules when it runs through the entry points.
 
+# Commands that end an interactive CLI chat session
+_EXIT_COMMANDS = frozenset({'quit', 'exit', 'bye'})
 
 
 def setup_logging(log_level: str = "INFO"):
@@ -35,7 +35,8 @@ def setup_logging(log_level: str = "INFO"):
     )
 
 
-def run_flask_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
+def run_flask_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False,
+                  runtime: str = "sync"):
     """
     Run the Flask web application.
     
@@ -43,12 +44,22 @@ def run_flask_app(host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
         host: Host address to bind to
         port: Port number to bind to
         debug: Enable debug mode
+        runtime: Server runtime, "sync" (threads) or "gevent" (greenlets)
     """
     logger = logging.getLogger(__name__)
     logger.info("Starting Non-LLM Chatbot Flask Application")
     
+    if runtime == "gevent":
+        # Must run before Flask, Werkzeug and SQLAlchemy are imported
+        from gevent import monkey
+        monkey.patch_all()
+    if __package__:
+        from .flask_app import ChatBotFlaskApp
+    else:
+        from flask_app import ChatBotFlaskApp
+    
     try:
-        app = ChatBotFlaskApp(host=host, port=port, debug=debug)
+        app = ChatBotFlaskApp(host=host, port=port, debug=debug, runtime=runtime)
         app.run()
     except Exception as e:
         logger.error(f"Error running Flask app: {str(e)}")
@@ -59,6 +70,10 @@ def run_cli_chat():
     """Run a command-line interface for the chatbot."""
     logger = logging.getLogger(__name__)
     logger.info("Starting Non-LLM Chatbot CLI")
+    if __package__:
+        from .chatbot import BasicChatBot
+    else:
+        from chatbot import BasicChatBot
     
     # Create and train a chatbot
     bot = BasicChatBot("CLIChatBot")
@@ -72,7 +87,7 @@ def run_cli_chat():
         while True:
             user_input = input("You: ").strip()
             
-            if user_input.lower() in ['quit', 'exit', 'bye']:
+            if user_input.lower() in _EXIT_COMMANDS:
                 print("Bot: Goodbye! Have a great day!")
                 break
             
@@ -99,6 +114,10 @@ def train_and_save_bot(bot_name: str, training_data_file: Optional[str] = None):
     """
     logger = logging.getLogger(__name__)
     logger.info(f"Creating and training bot: {bot_name}")
+    if __package__:
+        from .chatbot import BasicChatBot
+    else:
+        from chatbot import BasicChatBot
     
     try:
         bot = BasicChatBot(bot_name)
@@ -116,7 +135,8 @@ def train_and_save_bot(bot_name: str, training_data_file: Optional[str] = None):
         # Train with custom data if provided
         if training_data_file and os.path.exists(training_data_file):
             with open(training_data_file, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
+                # Stream the file instead of materializing readlines(), stripping each line once
+                lines = [text for text in (line.strip() for line in f) if text]
                 bot.train_with_conversations(lines)
                 logger.info(f"Trained with custom data from {training_data_file}")
         
@@ -129,6 +149,9 @@ def train_and_save_bot(bot_name: str, training_data_file: Optional[str] = None):
 
 def main():
     """Main entry point for the application."""
+    # Only the command line needs argparse; databricks_main and library users skip it
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Non-LLM Chatbot Application")
     parser.add_argument(
         "--mode",
@@ -152,6 +175,12 @@ def main():
         action="store_true",
         help="Enable debug mode for web mode"
     )
+    parser.add_argument(
+        "--runtime",
+        choices=["sync", "gevent"],
+        default="sync",
+        help="Server runtime for web mode: sync (threads) or gevent (greenlets, requires gevent)"
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -178,7 +207,7 @@ def main():
     
     try:
         if args.mode == "web":
-            run_flask_app(host=args.host, port=args.port, debug=args.debug)
+            run_flask_app(host=args.host, port=args.port, debug=args.debug, runtime=args.runtime)
         elif args.mode == "cli":
             run_cli_chat()
         elif args.mode == "train":
@@ -0,0 +1,61 @@
+"""
+Shared fixtures: a BasicChatBot whose ChatterBot instance is replaced by a stub.
+
+The stub keeps the bot's own logic (exact-match table, response cache,
+training bookkeeping) under test without loading ChatterBot, NLTK or a
+database.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from non_llm_chat import chatbot
+from non_llm_chat.chatbot import BasicChatBot, ResponseCache
+
+
+class StubChatterBot:
+    """Stands in for chatterbot.ChatBot: echoes each message and records it."""
+    
+    def __init__(self):
+        self.read_only = False
+        self.messages = []
+        self.reply = None
+    
+    def get_response(self, message):
+        self.messages.append(message)
+        return self.reply if self.reply is not None else f"echo: {message}"
+
+
+class StubChatBot(BasicChatBot):
+    """BasicChatBot built around StubChatterBot instead of ChatterBot."""
+    
+    def __init__(self, name="StubBot", database_path=":memory:", cache_size=256,
+                 read_only=False):
+        self.name = name
+        self.database_path = database_path
+        self.response_cache = ResponseCache(cache_size)
+        self._faq = {}
+        self.logger = logging.getLogger(__name__)
+        self.bot = StubChatterBot()
+        self.list_trainer = SimpleNamespace(trained=[])
+        self.list_trainer.train = self.list_trainer.trained.append
+    
+    def train_basic_conversations(self, skip_if_trained=False):
+        self.train_with_conversations(
+            tuple(line.format(name=self.name) for line in chatbot._BASIC_CONVERSATIONS)
+        )
+
+
+@pytest.fixture
+def stub_bot(monkeypatch):
+    monkeypatch.setattr(chatbot, "_ensure_nltk_data", lambda: None)
+    return StubChatBot()
+
+
+@pytest.fixture
+def stub_bots(monkeypatch):
+    """Make ChatBotManager build StubChatBot instances."""
+    monkeypatch.setattr(chatbot, "_ensure_nltk_data", lambda: None)
+    monkeypatch.setattr(chatbot, "BasicChatBot", StubChatBot)
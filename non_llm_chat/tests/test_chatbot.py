@@ -0,0 +1,89 @@
+"""
+Tests for the first-run training claim in BasicChatBot.train_basic_conversations.
+"""
+
+import pytest
+
+pytest.importorskip("chatterbot")
+pytest.importorskip("rapidfuzz")
+
+from sqlalchemy import text
+
+from non_llm_chat.chatbot import BasicChatBot
+
+STEP = "basic_conversations"
+
+
+@pytest.fixture
+def bot(tmp_path):
+    return BasicChatBot("TestBot", str(tmp_path / "testbot_db.sqlite3"))
+
+
+def _claim_value(bot):
+    with bot.bot.storage.engine.connect() as connection:
+        return connection.execute(
+            text("SELECT v FROM training_meta WHERE k = :k"), {'k': STEP}
+        ).scalar()
+
+
+def test_failed_training_releases_claim(bot, monkeypatch):
+    def fail(conversations):
+        raise LookupError("Resource punkt_tab not found.")
+    
+    monkeypatch.setattr(bot, "train_with_conversations", fail)
+    
+    with pytest.raises(LookupError):
+        bot.train_basic_conversations(skip_if_trained=True)
+    
+    assert _claim_value(bot) is None
+
+
+def test_successful_training_is_recorded(bot, monkeypatch):
+    trained = []
+    monkeypatch.setattr(bot, "train_with_conversations", trained.append)
+    
+    bot.train_basic_conversations(skip_if_trained=True)
+    
+    assert len(trained) == 1
+    assert _claim_value(bot) == "trained"
+
+
+def test_live_claim_is_respected(bot, monkeypatch):
+    # Another run is still training: its statements are only written once
+    # ListTrainer finishes, so the statement table is empty meanwhile
+    assert bot._claim_training(STEP)
+    trained = []
+    monkeypatch.setattr(bot, "train_with_conversations", trained.append)
+    
+    bot.train_basic_conversations(skip_if_trained=True)
+    
+    assert trained == []
+    assert _claim_value(bot) == "claimed"
+
+
+def test_expired_claim_is_taken_over(bot, monkeypatch):
+    # A previous run claimed the step and died before finishing
+    assert bot._claim_training(STEP)
+    with bot.bot.storage.engine.begin() as connection:
+        connection.execute(
+            text("UPDATE training_meta SET claimed_at = claimed_at - 3600 WHERE k = :k"),
+            {'k': STEP}
+        )
+    trained = []
+    monkeypatch.setattr(bot, "train_with_conversations", trained.append)
+    
+    bot.train_basic_conversations(skip_if_trained=True)
+    
+    assert len(trained) == 1
+    assert _claim_value(bot) == "trained"
+
+
+def test_trained_database_skips_training(bot, monkeypatch):
+    bot.bot.storage.create(text="Hello", in_response_to=None)
+    trained = []
+    monkeypatch.setattr(bot, "train_with_conversations", trained.append)
+    
+    bot.train_basic_conversations(skip_if_trained=True)
+    
+    assert trained == []
+    assert bot.get_response("hello") == "Hi there!"
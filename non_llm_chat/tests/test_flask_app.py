@@ -0,0 +1,123 @@
+"""
+Tests for the Flask routes, served by stub bots through the Flask test client.
+"""
+
+import pytest
+
+from non_llm_chat.flask_app import ChatBotFlaskApp
+
+
+@pytest.fixture
+def chat_app(stub_bots):
+    chat_app = ChatBotFlaskApp(max_concurrent_chats=1, queue_timeout=0.01, max_batch_size=3)
+    # Wait for the warm-up thread to finish building the default bot
+    chat_app.default_bot
+    yield chat_app
+    chat_app._training_executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def client(chat_app):
+    return chat_app.app.test_client()
+
+
+def test_chat_answers_with_default_bot(client):
+    response = client.post('/api/chat', json={"message": "Anything new?"})
+    
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "response": "echo: Anything new?",
+        "bot_name": "DefaultBot",
+        "status": "success"
+    }
+
+
+def test_chat_answers_trained_pairs_by_exact_match(chat_app, client):
+    response = client.post('/api/chat', json={"message": "  what is YOUR name? "})
+    
+    assert response.get_json()["response"] == "My name is DefaultBot."
+    # Only the prewarm message ever reached ChatterBot
+    assert len(chat_app.default_bot.bot.messages) == 1
+
+
+def test_chat_is_rejected_when_no_slot_is_free(chat_app, client):
+    chat_app._chat_slots.acquire()
+    try:
+        chat = client.post('/api/chat', json={"message": "Hello"})
+        batch = client.post('/api/chat/batch', json={"messages": ["Hello"]})
+    finally:
+        chat_app._chat_slots.release()
+    
+    assert chat.status_code == 503
+    assert chat.get_json()["error"] == "Server busy, please try again"
+    assert batch.status_code == 503
+    assert client.post('/api/chat', json={"message": "Hello"}).status_code == 200
+
+
+def test_chat_negotiates_msgpack(client):
+    msgpack = pytest.importorskip("msgpack")
+    
+    response = client.post(
+        '/api/chat',
+        data=msgpack.packb({"message": "Hello"}),
+        content_type="application/msgpack",
+        headers={"Accept": "application/msgpack"}
+    )
+    
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    assert msgpack.unpackb(response.data) == {
+        "response": "Hi there!",
+        "bot_name": "DefaultBot",
+        "status": "success"
+    }
+
+
+def test_batch_answers_messages_in_order(client):
+    response = client.post('/api/chat/batch', json={"messages": ["Hello", "Other", "Hello"]})
+    
+    assert response.status_code == 200
+    assert response.get_json()["responses"] == ["Hi there!", "echo: Other", "Hi there!"]
+
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {"messages": "Hello"},
+    {"messages": ["Hello", 1]},
+])
+def test_batch_rejects_invalid_messages(client, payload):
+    response = client.post('/api/chat/batch', json=payload)
+    
+    assert response.status_code == 400
+
+
+def test_batch_rejects_too_many_messages(client):
+    response = client.post('/api/chat/batch', json={"messages": ["Hello"] * 4})
+    
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("accept_encoding, content_encoding", [
+    ("identity", None),
+    ("gzip", "gzip"),
+])
+def test_index_is_revalidated_by_etag(client, accept_encoding, content_encoding):
+    first = client.get('/', headers={"Accept-Encoding": accept_encoding})
+    assert first.status_code == 200
+    assert first.headers.get("Content-Encoding") == content_encoding
+    
+    second = client.get('/', headers={
+        "Accept-Encoding": accept_encoding,
+        "If-None-Match": first.headers["ETag"]
+    })
+    
+    assert second.status_code == 304
+    assert second.data == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_index_etag_differs_per_encoding(client):
+    plain = client.get('/', headers={"Accept-Encoding": "identity"})
+    gzipped = client.get('/', headers={"Accept-Encoding": "gzip"})
+    
+    assert plain.headers["ETag"] != gzipped.headers["ETag"]
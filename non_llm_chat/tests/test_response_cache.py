@@ -0,0 +1,62 @@
+"""
+Tests for the response cache and exact-match table in front of ChatterBot.
+"""
+
+from non_llm_chat.chatbot import ResponseCache
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    
+    cache.put("c", "C")
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_zero_size_cache_stores_nothing():
+    cache = ResponseCache(max_size=0)
+    cache.put("a", "A")
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_normalized_repeat_is_served_from_cache(stub_bot):
+    assert stub_bot.get_response("What is new?") == "echo: What is new?"
+    assert stub_bot.get_response("  what IS   new? ") == "echo: What is new?"
+    
+    assert stub_bot.bot.messages == ["What is new?"]
+
+
+def test_time_replies_are_not_cached(stub_bot):
+    stub_bot.bot.reply = "The current time is 09:30 AM"
+    
+    stub_bot.get_response("What time is it now?")
+    stub_bot.get_response("What time is it now?")
+    
+    assert len(stub_bot.bot.messages) == 2
+    assert len(stub_bot.response_cache) == 0
+
+
+def test_training_clears_cache(stub_bot):
+    stub_bot.get_response("Favourite colour?")
+    assert len(stub_bot.response_cache) == 1
+    
+    stub_bot.train_with_conversations(["Favourite colour?", "Blue."])
+    
+    assert len(stub_bot.response_cache) == 0
+    assert stub_bot.get_response("favourite colour?") == "Blue."
+
+
+def test_trained_pairs_skip_chatterbot(stub_bot):
+    stub_bot.train_basic_conversations()
+    
+    assert stub_bot.get_response("  HELLO ") == "Hi there!"
+    assert stub_bot.get_response("What is your name?") == "My name is StubBot."
+    assert stub_bot.bot.messages == []